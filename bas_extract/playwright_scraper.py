@@ -1,8 +1,10 @@
 import asyncio, os, re
 from datetime import datetime
+from urllib.parse import urljoin
 from playwright.async_api import async_playwright
 from .utils import sleep_ms
 from .parsers import parse_table_rows
+from .results_grid import harvest_results
 from .storage import persist_rows, save_snapshot
 from .municipalities import DEFAULT_COLLECTIONS_PER_SLUG
 
@@ -126,100 +128,52 @@ async def extract_bill_data_from_current_page(page, municipality_slug: str, coll
     return record, is_unpaid
 
 async def process_pagination(page, view_bill_links_selector, municipality_slug: str, collection_label: str, search_term: str, ts: str, all_records: list):
-    """Process all pages of search results with pagination support"""
-    current_page = 1
-    max_pages = 10  # Reasonable limit to prevent infinite loops
-
-    while current_page <= max_pages:
-        print(f"Processing page {current_page} for search term '{search_term}'")
-
-        # Look for "view bill" links on current page
-        view_bill_links = page.locator(view_bill_links_selector)
-        link_count = await view_bill_links.count()
-
-        if link_count > 0:
-            print(f"Found {link_count} 'view bill' links on page {current_page}")
-
-            # Process each view bill link on this page
-            for i in range(link_count):
-                try:
-                    # Get the href of the current link
-                    link = view_bill_links.nth(i)
-                    href = await link.get_attribute("href")
-
-                    if href:
-                        # Make the URL absolute if it's relative
-                        if href.startswith("/"):
-                            from urllib.parse import urljoin
-                            bill_url = urljoin(page.url, href)
-                        elif not href.startswith("http"):
-                            bill_url = f"{page.url.rstrip('/')}/{href}"
-                        else:
-                            bill_url = href
-
-                        print(f"Processing bill {i+1}/{link_count} on page {current_page}: {bill_url}")
-
-                        # Navigate to the bill detail page
-                        await page.goto(bill_url, wait_until="domcontentloaded")
-                        #await sleep_ms(800)
-                        print("sleep 2 500 ms")
-                        await sleep_ms(500)
-
-                        # Extract data from this bill detail page
-                        record, is_unpaid = await extract_bill_data_from_current_page(
-                            page, municipality_slug, collection_label, str(search_term), ts
-                        )
-
-                        # Add ALL records (both paid and unpaid) to the dataset
-                        all_records.append(record)
-
-                        if is_unpaid:
-                            print(f"Found UNPAID record: {record.get('owner_name', 'Unknown')} - Amount due: {record.get('amount_due', 'Unknown')}")
-                        else:
-                            print(f"Found PAID record: {record.get('owner_name', 'Unknown')} - Status: {record.get('payment_type', 'Paid')}")
-
-                        # Navigate back to search results page for next link
-                        await page.go_back()
-                        #await sleep_ms(800)
-                        print("sleep 3 500 ms")
-                        await sleep_ms(500)
-
-
-                        # Re-locate the view bill links after going back
-                        view_bill_links = page.locator(view_bill_links_selector)
-
-                except Exception as e:
-                    print(f"[WARN] Error processing bill link {i+1} on page {current_page}: {e}")
-                    continue
-
-        # Look for "Next" or pagination links
-        next_page_found = False
-        next_selectors = [
-            "a:has-text('Next')",
-            "a:has-text('>')",
-            f"a:has-text('{current_page + 1}')",
-            "input[value='Next']",
-            "button:has-text('Next')"
-        ]
-
-        for selector in next_selectors:
-            next_link = page.locator(selector)
-            if await next_link.count() > 0:
-                try:
-                    await next_link.first.click()
-                    await page.wait_for_load_state("networkidle")
-                    print("sleep 4.  800 ms")
-                    await sleep_ms(800)
-                    next_page_found = True
-                    current_page += 1
-                    break
-                except Exception as e:
-                    print(f"[WARN] Error clicking next page with selector '{selector}': {e}")
-                    continue
-
-        if not next_page_found:
-            print(f"No more pages found after page {current_page}")
-            break
+    """Process all pages of search results: harvest every grid page concurrently, then visit each bill"""
+    results_url = page.url
+    harvested = await harvest_results(page)
+    if not harvested:
+        # Not the standard results grid; fall back to the links on the current page
+        links = page.locator(view_bill_links_selector)
+        harvested = [{"detail_url": urljoin(results_url, href)}
+                     for href in await links.evaluate_all("els => els.map(e => e.getAttribute('href'))") if href]
+
+    if not harvested:
+        print(f"No 'view bill' links found for address {search_term}")
+        return len(all_records)
+
+    print(f"Found {len(harvested)} 'view bill' links for address {search_term}")
+
+    for i, row in enumerate(harvested):
+        try:
+            bill_url = row["detail_url"]
+            print(f"Processing bill {i+1}/{len(harvested)}: {bill_url}")
+
+            # Navigate to the bill detail page
+            await page.goto(bill_url, wait_until="domcontentloaded")
+            print("sleep 10. 200 ms")
+            await sleep_ms(200)
+
+            # Extract data from this bill detail page
+            record, is_unpaid = await extract_bill_data_from_current_page(
+                page, municipality_slug, collection_label, str(search_term), ts
+            )
+
+            # Fall back to the results grid columns when the bill page lacks them
+            for key in ("owner_name", "parcel_id", "property_address"):
+                if not record.get(key) and row.get(key):
+                    record[key] = row[key]
+
+            # Add ALL records (both paid and unpaid) to the dataset
+            all_records.append(record)
+
+            if is_unpaid:
+                print(f"Found UNPAID record for {municipality_slug}: {record.get('owner_name', 'Unknown')} - Amount due: {record.get('amount_due', 'Unknown')}")
+            else:
+                print(f"Found PAID record for {municipality_slug}: {record.get('owner_name', 'Unknown')} - Status: {record.get('payment_type', 'Paid')}")
+
+        except Exception as e:
+            print(f"[WARN] Error processing bill link {i+1} for address {search_term}: {e}")
+            continue
 
     return len(all_records)
 
@@ -324,64 +278,11 @@ async def fetch_collection(page, base_url:str, collection_label:str, municipalit
                     # We might be on a search results page with multiple properties
                     # Save a snapshot for debugging if this is the first search
                     print(f"On search results page for address {address_num}")
-                    # Look for "view bill" links or property list on this page
-                    view_bill_links = page.locator("a").filter(has_text=re.compile("view bill", re.I))
-                    link_count = await view_bill_links.count()
-
-                    if link_count > 0:
-                        print(f"Found {link_count} 'view bill' links for address {address_num}")
-                        #link_count = 3
-                        # Process each view bill link
-                        for i in range(link_count):
-                            try:
-                                # Get the href of the current link
-                                link = view_bill_links.nth(i)
-                                href = await link.get_attribute("href")
-
-                                if href:
-                                    # Make the URL absolute if it's relative
-                                    if href.startswith("/"):
-                                        from urllib.parse import urljoin
-                                        bill_url = urljoin(base_url, href)
-                                    elif not href.startswith("http"):
-                                        bill_url = f"{base_url.rstrip('/')}/{href}"
-                                    else:
-                                        bill_url = href
-
-                                    print(f"Processing bill {i+1}/{link_count}: {bill_url}")
-
-                                    # Navigate to the bill detail page
-                                    await page.goto(bill_url, wait_until="domcontentloaded")
-                                    print("sleep 10. 200 ms")
-                                    await sleep_ms(200)
-
-                                    # Extract data from this bill detail page
-                                    record, is_unpaid = await extract_bill_data_from_current_page(
-                                        page, municipality_slug, collection_label, str(address_num), ts
-                                    )
-
-                                    # Add ALL records (both paid and unpaid) to the dataset
-                                    all_records.append(record)
-
-                                    if is_unpaid:
-                                        print(f"Found UNPAID record for {municipality_slug}: {record.get('owner_name', 'Unknown')} - Amount due: {record.get('amount_due', 'Unknown')}")
-                                    else:
-                                        print(f"Found PAID record for {municipality_slug}: {record.get('owner_name', 'Unknown')} - Status: {record.get('payment_type', 'Paid')}")
-
-                                    # Navigate back to search results page for next link
-                                    await page.go_back()
-                                    print("sleep 11. 200 ms")
-                                    await sleep_ms(200)
-
-                                    # Re-locate the view bill links after going back
-                                    view_bill_links = page.locator("a").filter(has_text=re.compile("view bill", re.I))
-
-                            except Exception as e:
-                                print(f"[WARN] Error processing bill link {i+1} for address {address_num}: {e}")
-                                continue
-
-                    else:
-                        print(f"No 'view bill' links found for address {address_num}")
+                    # Harvest every page of the results grid, not just the first one
+                    await process_pagination(
+                        page, "a:text-matches('view bill', 'i')",
+                        municipality_slug, collection_label, str(address_num), ts, all_records
+                    )
 
                 # Navigate back to the main search page for next address search
                 await page.goto(base_url, wait_until="domcontentloaded")
@@ -0,0 +1,190 @@
+import asyncio, os, re
+from .utils import sleep_ms
+
+GRID_ID = "Results1_gdvResults"
+GRID_TARGET = "Results1$gdvResults"
+
+_PAGE_ARG = re.compile(r"__doPostBack\('Results1\$gdvResults','Page\$([^']+)'\)")
+
+# One JS round trip per grid page instead of one per cell
+_ROWS_JS = """
+grid => Array.from(grid.querySelectorAll('a'))
+  .filter(a => /view bill/i.test(a.textContent))
+  .map(a => {
+    const cells = Array.from(a.closest('tr').querySelectorAll('td')).map(td => td.innerText.trim());
+    return {detail_url: a.href, cells: cells};
+  })
+"""
+
+def plan_page_jobs(seen: set, index, page_args) -> list:
+    """Return the (postback argument, page index) jobs to queue after landing on page `index`.
+
+    `seen` holds the page indexes already fetched or queued and is updated in place.
+    Numeric arguments (including the '...' links) are absolute page numbers; Next is
+    followed from any page whose index is known, so NextPrevious pagers are walked to
+    the end; Last is queued once as an extra seed with an unknown index (None), which
+    lets numeric pagers discover the tail windows in parallel with the head.
+    """
+    jobs = []
+    for n in sorted(int(a) for a in page_args if a.isdigit()):
+        if n not in seen:
+            seen.add(n)
+            jobs.append((f"Page${n}", n))
+    if index is not None and "Next" in page_args and index + 1 not in seen:
+        seen.add(index + 1)
+        jobs.append(("Page$Next", index + 1))
+    if "Last" in page_args and "Last" not in seen:
+        seen.add("Last")
+        jobs.append(("Page$Last", None))
+    return jobs
+
+async def read_page_args(page) -> set:
+    """Return the Page$ postback arguments linked from the results grid pager"""
+    args = set()
+    links = page.locator(f"#{GRID_ID} a[href*='__doPostBack']")
+    for href in await links.evaluate_all("els => els.map(e => e.getAttribute('href'))"):
+        m = _PAGE_ARG.search(href or "")
+        if m:
+            args.add(m.group(1))
+    return args
+
+async def shown_grid_page(page):
+    """Page number the pager marks as current (the un-linked <span>); None for Next/Previous pagers"""
+    spans = page.locator(f"#{GRID_ID} table span")
+    for text in await spans.all_inner_texts():
+        if text.strip().isdigit():
+            return int(text.strip())
+    return None
+
+async def read_grid_rows(page):
+    """Extract every 'View Bill' row of the results grid currently loaded in page"""
+    grid = page.locator(f"#{GRID_ID}")
+    if await grid.count() == 0:
+        return []
+    rows = []
+    for item in await grid.evaluate(_ROWS_JS):
+        cells = item["cells"]
+        row = {"detail_url": item["detail_url"]}
+        # Owner / SBL / Address columns, used when the bill page lacks them
+        if len(cells) >= 3:
+            row["owner_name"] = cells[0]
+            row["parcel_id"] = cells[1]
+            row["property_address"] = cells[2]
+        rows.append(row)
+    return rows
+
+async def _load_results_copy(page, url: str, html: str):
+    """Load a captured results page at its real URL so its form (and __VIEWSTATE) posts back to the site"""
+    async def serve(route):
+        await route.fulfill(body=html, content_type="text/html; charset=utf-8")
+    matcher = lambda u: u == url
+    await page.route(matcher, serve)
+    try:
+        await page.goto(url, wait_until="domcontentloaded")
+    finally:
+        await page.unroute(matcher, serve)
+
+async def _grid_postback(page, argument: str):
+    async with page.expect_navigation(wait_until="domcontentloaded"):
+        await page.evaluate("([t, a]) => __doPostBack(t, a)", [GRID_TARGET, argument])
+
+async def harvest_results(page, concurrency: int = None):
+    """Collect the rows of every page of the results grid currently shown in page.
+
+    The pager is read once and the remaining pages are fetched concurrently, each in
+    its own tab of the same browser context replaying the Page$ postback against a
+    copy of the page that linked to it. Pages beyond the visible pager window are
+    discovered from the pages that reveal them (see plan_page_jobs), so there is no
+    page cap. Failed postbacks are retried and reported in the summary line.
+    """
+    if concurrency is None:
+        concurrency = int(os.getenv("BAS_HARVEST_CONCURRENCY", "4"))
+    retries = int(os.getenv("BAS_HARVEST_RETRIES", "2"))
+    url = page.url
+
+    rows_by_url = {}
+    def collect(rows):
+        for row in rows:
+            rows_by_url.setdefault(row["detail_url"], row)
+
+    collect(await read_grid_rows(page))
+    first_index = await shown_grid_page(page) or 1
+    seen = {first_index}
+    queue = asyncio.Queue()
+    failed = []
+
+    def schedule(html, index, page_args):
+        for argument, expected in plan_page_jobs(seen, index, page_args):
+            queue.put_nowait((html, argument, expected))
+
+    schedule(await page.content(), first_index, await read_page_args(page))
+    if queue.empty():
+        print(f"Harvested {len(rows_by_url)} unique rows from results grid (single page)")
+        return list(rows_by_url.values())
+
+    tabs = []
+    for _ in range(max(1, concurrency)):
+        try:
+            tabs.append(await page.context.new_page())
+        except Exception as e:
+            print(f"[WARN] Could not open harvest tab: {e}")
+            break
+
+    print(f"Harvesting results grid: {len(rows_by_url)} rows on page {first_index}, {queue.qsize()} postbacks queued, {len(tabs)} tabs")
+
+    async def fetch(tab, html, argument, expected):
+        await _load_results_copy(tab, url, html)
+        await _grid_postback(tab, argument)
+        rows = await read_grid_rows(tab)
+        collect(rows)
+        index = expected if expected is not None else await shown_grid_page(tab)
+        if index is not None:
+            seen.add(index)
+        print(f"Harvested {len(rows)} rows from page {index or '?'} ({argument})")
+        page_args = await read_page_args(tab)
+        if page_args:
+            # Page postbacks only reach pages near the one they were issued from
+            schedule(await tab.content(), index, page_args)
+
+    async def worker(tab):
+        while True:
+            html, argument, expected = await queue.get()
+            try:
+                for attempt in range(retries + 1):
+                    try:
+                        await fetch(tab, html, argument, expected)
+                        break
+                    except Exception as e:
+                        print(f"[WARN] Error harvesting results grid {argument} (attempt {attempt + 1}/{retries + 1}): {e}")
+                else:
+                    failed.append(argument)
+            finally:
+                queue.task_done()
+            await sleep_ms(int(os.getenv("BAS_HARVEST_DELAY_MS", "200")))
+
+    workers = [asyncio.create_task(worker(tab)) for tab in tabs]
+    joiner = asyncio.create_task(queue.join())
+    pending = set(workers) | {joiner}
+    while True:
+        if pending == {joiner}:
+            # No live workers left; whatever is still queued will never be fetched
+            while not queue.empty():
+                failed.append(queue.get_nowait()[1])
+                queue.task_done()
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        if joiner in done:
+            break
+    for w in workers:
+        w.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+    for tab in tabs:
+        try:
+            await tab.close()
+        except Exception:
+            pass
+
+    summary = f"Harvested {len(rows_by_url)} unique rows from results grid"
+    if failed:
+        summary += f", {len(failed)} page postbacks FAILED: {', '.join(failed)}"
+    print(summary)
+    return list(rows_by_url.values())
@@ -0,0 +1,64 @@
+import pytest
+from bas_extract.results_grid import plan_page_jobs
+
+WINDOW = 10
+
+def pager(mode, index, total):
+    """Page$ arguments and current-page span an ASP.NET GridView renders for page `index`"""
+    if total == 1:
+        return set(), None
+    args = set()
+    if mode.startswith("Numeric"):
+        start = (index - 1) // WINDOW * WINDOW + 1
+        end = min(start + WINDOW - 1, total)
+        args |= {str(n) for n in range(start, end + 1) if n != index}
+        if start > 1:
+            args.add(str(start - 1))
+            if mode == "NumericFirstLast":
+                args.add("First")
+        if end < total:
+            args.add(str(end + 1))
+            if mode == "NumericFirstLast":
+                args.add("Last")
+        return args, index
+    if index > 1:
+        args |= {"Prev"} | ({"First"} if mode == "NextPreviousFirstLast" else set())
+    if index < total:
+        args |= {"Next"} | ({"Last"} if mode == "NextPreviousFirstLast" else set())
+    return args, None
+
+def harvest(mode, total):
+    """Drive plan_page_jobs the way harvest_results does; return the pages fetched"""
+    args, shown = pager(mode, 1, total)
+    seen = {1}
+    queue = [(1, a, e) for a, e in plan_page_jobs(seen, 1, args)]
+    fetched = [1]
+    while queue:
+        parent, argument, expected = queue.pop(0)
+        target = {"Page$Next": parent + 1, "Page$Last": total}.get(argument) or int(argument.split("$")[1])
+        fetched.append(target)
+        args, shown = pager(mode, target, total)
+        index = expected if expected is not None else shown
+        if index is not None:
+            seen.add(index)
+        queue += [(target, a, e) for a, e in plan_page_jobs(seen, index, args)]
+    return fetched
+
+@pytest.mark.parametrize("mode", ["Numeric", "NumericFirstLast", "NextPrevious", "NextPreviousFirstLast"])
+@pytest.mark.parametrize("total", [1, 2, 3, 10, 11, 47])
+def test_every_page_is_fetched(mode, total):
+    fetched = harvest(mode, total)
+    assert set(fetched) == set(range(1, total + 1))
+    # At most the Page$Last seed is fetched twice
+    assert len(fetched) <= total + 1
+
+def test_last_seeds_tail_windows_of_numeric_pager():
+    seen = {1}
+    jobs = plan_page_jobs(seen, 1, pager("NumericFirstLast", 1, 47)[0])
+    assert ("Page$11", 11) in jobs and ("Page$Last", None) in jobs
+
+def test_next_is_queued_alongside_last():
+    seen = {1}
+    jobs = plan_page_jobs(seen, 1, {"Next", "Last"})
+    assert jobs == [("Page$Next", 2), ("Page$Last", None)]
+    assert plan_page_jobs(seen, 1, {"Next", "Last"}) == []